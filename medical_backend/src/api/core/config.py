@@ -1,13 +1,17 @@
 import os
 from functools import lru_cache
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
-class Settings(BaseModel):
+class Settings(BaseSettings):
     """
-    Application settings loaded from environment variables.
+    Application settings loaded from environment variables (and an optional .env file).
     Note: Do not hardcode secrets. Ask orchestrator to provide values via .env.
     """
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
     THEME_NAME: str = Field(default="Ocean Professional", description="UI/Docs theme name.")
     THEME_PRIMARY: str = Field(default="#2563EB", description="Primary color (blue).")
     THEME_SECONDARY: str = Field(default="#F59E0B", description="Secondary color (amber).")
@@ -15,20 +19,46 @@ class Settings(BaseModel):
     # Storage paths (OneDrive-synced and local storage)
     # Defaults point to writable relative paths inside the application workspace to avoid permission errors
     # in environments where writing to /data is not allowed. These can be overridden via environment variables.
-    ONEDRIVE_BASE_PATH: str = Field(default_factory=lambda: os.getenv("ONEDRIVE_BASE_PATH", os.path.abspath("./var/onedrive")))
-    STORAGE_BASE_PATH: str = Field(default_factory=lambda: os.getenv("STORAGE_BASE_PATH", os.path.abspath("./var/storage")))
+    ONEDRIVE_BASE_PATH: str = Field(default_factory=lambda: os.path.abspath("./var/onedrive"))
+    STORAGE_BASE_PATH: str = Field(default_factory=lambda: os.path.abspath("./var/storage"))
 
     # Vector DB connectivity (assumed provided by system design)
-    VECTOR_DB_URL: str = Field(default_factory=lambda: os.getenv("VECTOR_DB_URL", "http://medical_vector_database:8000"))
-    VECTOR_DB_API_KEY: str = Field(default_factory=lambda: os.getenv("VECTOR_DB_API_KEY", ""))
+    VECTOR_DB_URL: str = "http://medical_vector_database:8000"
+    VECTOR_DB_API_KEY: str = ""
+    # RAG result cache (per normalized query + top_k); set max entries to 0 to disable
+    VECTOR_CACHE_TTL_SECS: float = 300.0
+    VECTOR_CACHE_MAX_ENTRIES: int = 512
+    # Advisor suggestion memo (per transcript + max_items); set max entries to 0 to disable
+    ADVISOR_CACHE_TTL_SECS: float = 300.0
+    ADVISOR_CACHE_MAX_ENTRIES: int = 128
+
+    # CORS (comma-separated in env, not JSON; normalized once by the validator below)
+    CORS_ALLOW_ORIGINS: Annotated[list[str], NoDecode] = Field(default="*", validate_default=True)
 
-    # CORS
-    CORS_ALLOW_ORIGINS: list[str] = Field(
-        default_factory=lambda: os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
-    )
+    # Interview sessions: idle sessions (and the oldest beyond the cap) are evicted and their transcripts saved
+    INTERVIEW_SESSION_MAX_ACTIVE: int = 10_000
+    INTERVIEW_SESSION_IDLE_TTL_SECS: float = 3600.0
 
     # Logging
-    LOG_LEVEL: str = Field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    LOG_LEVEL: str = "INFO"
+
+    # Diagnostics: per-route request timing plus GET /admin/profile/top (off by default)
+    MEDICAL_PROFILE: bool = False
+
+    @field_validator("CORS_ALLOW_ORIGINS", mode="before")
+    @classmethod
+    def _parse_cors_origins(cls, value: Any) -> list[str]:
+        """Split, strip and dedupe origins; any '*' collapses the list to ['*']."""
+        items = value.split(",") if isinstance(value, str) else list(value or [])
+        origins = list(dict.fromkeys(o.strip() for o in items if o and o.strip()))
+        if "*" in origins:
+            return ["*"]
+        return origins
+
+    @property
+    def cors_allow_credentials(self) -> bool:
+        """Credentials are only allowed with an explicit origin list (browsers reject them with '*')."""
+        return self.CORS_ALLOW_ORIGINS != ["*"]
 
 
 @lru_cache(maxsize=1)
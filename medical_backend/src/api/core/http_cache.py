@@ -0,0 +1,26 @@
+from fastapi import Request, Response
+
+
+# PUBLIC_INTERFACE
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    True if the request's If-None-Match header matches etag.
+    Uses the weak comparison required for If-None-Match (W/ prefixes are ignored); '*' matches anything.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+# PUBLIC_INTERFACE
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -1,15 +1,26 @@
 import logging
 import logging.handlers
 import os
+import queue
+from typing import Optional
 from .config import get_settings
 
+# Background listener draining the log queue into the file/console handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 
 def configure_logging() -> None:
     """
     Configure application-wide logging for agent activities and API events.
     Style aligns with 'Ocean Professional' – clean, structured, and informative.
+
+    Records are handed to a QueueHandler on the calling thread; file and console
+    output happen on a background QueueListener thread so request handlers never
+    block on disk writes or log rotation.
     """
     # PUBLIC_INTERFACE
+    global _listener, _queue_handler
     settings = get_settings()
     log_dir = os.path.join(settings.STORAGE_BASE_PATH, "logs")
     os.makedirs(log_dir, exist_ok=True)
@@ -38,7 +49,29 @@ def configure_logging() -> None:
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)
 
-    root.addHandler(file_handler)
-    root.addHandler(console_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
 
     logging.getLogger("app").info("Logging configured. Level=%s", settings.LOG_LEVEL)
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background log listener, flushing any queued records,
+    and detach the queue handler so logging can be configured again.
+    """
+    # PUBLIC_INTERFACE
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -1,6 +1,8 @@
-from typing import Any, Dict, List
-from fastapi import FastAPI
+from typing import Any, Dict, List, Sequence, Type
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.openapi.utils import get_openapi
+from pydantic import BaseModel
 from .config import get_settings
 
 
@@ -33,45 +35,61 @@ def swagger_ui_parameters() -> Dict[str, Any]:
     }
 
 
-def build_openapi(app: FastAPI):
+def build_openapi_schema(app: FastAPI, extra_models: Sequence[Type[BaseModel]] = ()) -> Dict[str, Any]:
     """
-    Build the OpenAPI schema once and cache it on the app.
-    Adds theme metadata into components.extensions for clarity.
+    Build the OpenAPI schema for the app, including theme metadata in components.
 
-    Note:
-    - Do NOT call app.openapi() here as it will point back to this function after override,
-      causing recursion and a 500 at /openapi.json. Use fastapi.openapi.utils.get_openapi.
+    extra_models are added to components.schemas (under their class names) for routes
+    that reference a body model FastAPI does not know about, e.g. via openapi_extra.
+
+    Call this once after all routes are registered and assign the result to
+    app.openapi_schema; FastAPI's own app.openapi() then returns the cached
+    schema directly on every /openapi.json request.
     """
     # PUBLIC_INTERFACE
-    def _openapi():
-        # Return cached schema if present
-        if getattr(app, "openapi_schema", None):
-            return app.openapi_schema
+    settings = get_settings()
+
+    # Generate schema using FastAPI utility
+    openapi_schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
+        tags=openapi_tags(),
+    )
+
+    # Inject theme metadata
+    theme = {
+        "themeName": settings.THEME_NAME,
+        "colors": {
+            "primary": settings.THEME_PRIMARY,
+            "secondary": settings.THEME_SECONDARY,
+        },
+        "style": "Modern minimalist with blue & amber accents",
+    }
+    components = openapi_schema.setdefault("components", {})
+    components["x-theme"] = theme
 
-        # Generate schema using FastAPI utility
-        openapi_schema = get_openapi(
-            title=app.title,
-            version=app.version,
-            description=app.description,
-            routes=app.routes,
-            tags=openapi_tags(),
-        )
+    schemas = components.setdefault("schemas", {})
+    for model in extra_models:
+        model_schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+        schemas.update(model_schema.pop("$defs", {}))
+        schemas[model.__name__] = model_schema
+    return openapi_schema
 
-        # Inject theme metadata
-        theme = {
-            "themeName": get_settings().THEME_NAME,
-            "colors": {
-                "primary": get_settings().THEME_PRIMARY,
-                "secondary": get_settings().THEME_SECONDARY,
-            },
-            "style": "Modern minimalist with blue & amber accents",
-        }
-        if "components" not in openapi_schema:
-            openapi_schema["components"] = {}
-        openapi_schema["components"]["x-theme"] = theme
 
-        # Cache schema on app
-        app.openapi_schema = openapi_schema
-        return app.openapi_schema
+def serve_cached_openapi(app: FastAPI) -> None:
+    """
+    Serialize app.openapi_schema once and replace FastAPI's /openapi.json route
+    with one that returns the pre-encoded bytes (no per-request JSON encoding).
+    """
+    # PUBLIC_INTERFACE
+    openapi_url = app.openapi_url
+    if not openapi_url:
+        return
+    openapi_bytes = orjson.dumps(app.openapi_schema)
+    app.router.routes[:] = [r for r in app.router.routes if getattr(r, "path", None) != openapi_url]
 
-    return _openapi
+    @app.get(openapi_url, include_in_schema=False)
+    async def openapi_json() -> Response:
+        return Response(content=openapi_bytes, media_type="application/json")
@@ -0,0 +1,82 @@
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Query
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RouteProfile:
+    """
+    Accumulated wall-clock time per route (in nanoseconds) since process start.
+    Keys look like "GET /patients/{patient_id}"; requests that match no route are "<unmatched>".
+    """
+
+    def __init__(self) -> None:
+        self.total_ns: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.max_ns: Dict[str, int] = {}
+
+    def record(self, key: str, elapsed_ns: int) -> None:
+        self.total_ns[key] += elapsed_ns
+        self.calls[key] += 1
+        if elapsed_ns > self.max_ns.get(key, 0):
+            self.max_ns[key] = elapsed_ns
+
+    # PUBLIC_INTERFACE
+    def top(self, n: int = 20) -> List[Dict[str, Any]]:
+        """Return the n routes with the most accumulated time, with call counts and mean/max latency."""
+        rows = []
+        for key, total in self.total_ns.most_common(n):
+            calls = self.calls[key]
+            rows.append(
+                {
+                    "route": key,
+                    "calls": calls,
+                    "total_ms": round(total / 1e6, 3),
+                    "mean_ms": round(total / calls / 1e6, 3),
+                    "max_ms": round(self.max_ns[key] / 1e6, 3),
+                }
+            )
+        return rows
+
+
+class AsyncProfilerMiddleware:
+    """
+    Pure ASGI middleware timing each HTTP request from first byte in to last byte out
+    and recording it under its matched route template.
+    """
+
+    def __init__(self, app: ASGIApp, profile: RouteProfile) -> None:
+        self.app = app
+        self.profile = profile
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        t0 = time.perf_counter_ns()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # The router stores the matched route in the (shared) scope dict
+            route = scope.get("route")
+            key = f"{scope['method']} {route.path}" if route is not None else "<unmatched>"
+            self.profile.record(key, time.perf_counter_ns() - t0)
+
+
+def install_profiler(app: FastAPI) -> RouteProfile:
+    """
+    Enable request profiling (MEDICAL_PROFILE=1): adds AsyncProfilerMiddleware and
+    a hidden GET /admin/profile/top endpoint listing the slowest routes by accumulated time.
+    Nothing is installed when profiling is off, so there is no per-request cost.
+    """
+    # PUBLIC_INTERFACE
+    profile = RouteProfile()
+    app.add_middleware(AsyncProfilerMiddleware, profile=profile)
+
+    @app.get("/admin/profile/top", include_in_schema=False)
+    async def profile_top(n: int = Query(20, ge=1, le=500)) -> List[Dict[str, Any]]:
+        return profile.top(n)
+
+    return profile
@@ -5,12 +5,15 @@ from typing import Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .routers import patients, agents, files
 from .routers import interview_session
-from .core.logging_conf import configure_logging
+from .core.logging_conf import configure_logging, shutdown_logging
 from .core.config import get_settings
-from .core.openapi import build_openapi, openapi_tags, swagger_ui_parameters
+from .core.profiling import install_profiler
+from .services.vector_client import vector_client
+from .core.openapi import build_openapi_schema, openapi_tags, serve_cached_openapi, swagger_ui_parameters
 
 
 @asynccontextmanager
@@ -27,7 +30,10 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.STORAGE_BASE_PATH, exist_ok=True)
     logging.getLogger("app").info("Application startup complete.")
     yield
+    # Release pooled vector DB connections
+    await vector_client.aclose()
     logging.getLogger("app").info("Application shutdown complete.")
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -48,17 +54,23 @@ def create_app() -> FastAPI:
         contact={"name": "Medical Insights Team"},
         license_info={"name": "Proprietary"},
         lifespan=lifespan,
+        # Serialize JSON responses with orjson (native datetime support, C implementation)
+        default_response_class=ORJSONResponse,
         swagger_ui_parameters=swagger_ui_parameters(),
     )
 
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ALLOW_ORIGINS,
-        allow_credentials=True,
+        allow_credentials=settings.cors_allow_credentials,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+    # Opt-in per-route latency profiling (MEDICAL_PROFILE=1); added last so it times the whole stack
+    if settings.MEDICAL_PROFILE:
+        install_profiler(app)
+
     # Include routers
     app.include_router(patients.router)
     # interviews router removed; interactive-only via /interview-session
@@ -66,10 +78,6 @@ def create_app() -> FastAPI:
     app.include_router(agents.router)
     app.include_router(files.router)
 
-    # OpenAPI customizations
-    app.openapi_tags = openapi_tags()
-    app.openapi = build_openapi(app)
-
     # Health endpoint
     @app.get("/", tags=["health"], summary="Health Check", description="Simple liveness probe.")
     # PUBLIC_INTERFACE
@@ -89,6 +97,12 @@ def create_app() -> FastAPI:
         """Describe websocket usage when available."""
         return {"message": "No websocket endpoints currently available."}
 
+    # OpenAPI customizations: build the schema once, after every route is registered,
+    # so FastAPI serves the cached schema without rebuilding it.
+    app.openapi_tags = openapi_tags()
+    app.openapi_schema = build_openapi_schema(app, extra_models=interview_session.BODY_MODELS)
+    serve_cached_openapi(app)
+
     return app
 
 
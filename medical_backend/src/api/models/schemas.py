@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PatientBase(BaseModel):
@@ -27,6 +27,9 @@ class PatientUpdate(BaseModel):
 
 class Patient(PatientBase):
     """Full patient record."""
+    # Records are replaced (model_copy) rather than mutated in place
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique patient identifier")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
@@ -1,19 +1,44 @@
+import asyncio
+import codecs
 import os
-from typing import Tuple
+from typing import AsyncIterator, TextIO, Tuple
 
 from ..core.config import get_settings
 
+# Characters per chunk when streaming file contents
+STREAM_CHUNK_CHARS = 64 * 1024
+# Bytes per block when checking a whole file is valid UTF-8 before streaming it
+UTF8_CHECK_BLOCK_BYTES = 256 * 1024
 
-def _safe_join(base: str, relative_path: str) -> str:
+
+def _safe_join(base_abs: str, relative_path: str) -> str:
     """
-    Safely join a base path and a relative path, preventing path traversal.
+    Safely join an absolute base path and a relative path, preventing path traversal.
+    The target must be the base itself or live strictly below it (so '/x/base2' does not pass for '/x/base').
     """
-    target = os.path.normpath(os.path.join(base, relative_path))
-    if not target.startswith(os.path.abspath(base)):
+    target = os.path.normpath(os.path.join(base_abs, relative_path))
+    if target != base_abs and not target.startswith(base_abs + os.sep):
         raise ValueError("Invalid path; attempted path traversal detected.")
     return target
 
 
+def write_file_bytes(path: str, data: bytes) -> None:
+    """
+    Write already-encoded content to path (create/truncate) using raw os.write calls,
+    bypassing the TextIOWrapper/BufferedWriter stack of open(..., "w").
+    """
+    # PUBLIC_INTERFACE
+    # 0o666 matches open()'s default mode; the process umask still applies.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 class FilesRepository:
     """
     Repository to read/write from OneDrive-synced and local storage paths.
@@ -21,12 +46,17 @@ class FilesRepository:
 
     def __init__(self) -> None:
         self.settings = get_settings()
+        # Base paths are stable config values; resolve them once
+        self._onedrive_abs = os.path.abspath(self.settings.ONEDRIVE_BASE_PATH)
+        self._storage_abs = os.path.abspath(self.settings.STORAGE_BASE_PATH)
+
+    def _base(self, use_onedrive: bool) -> str:
+        return self._onedrive_abs if use_onedrive else self._storage_abs
 
     # PUBLIC_INTERFACE
     def read(self, relative_path: str, use_onedrive: bool = True) -> Tuple[str, str]:
         """Read text content from a file under the chosen base directory."""
-        base = self.settings.ONEDRIVE_BASE_PATH if use_onedrive else self.settings.STORAGE_BASE_PATH
-        full = _safe_join(base, relative_path)
+        full = _safe_join(self._base(use_onedrive), relative_path)
         with open(full, "r", encoding="utf-8") as f:
             content = f.read()
         return relative_path, content
@@ -34,12 +64,57 @@ class FilesRepository:
     # PUBLIC_INTERFACE
     def write(self, relative_path: str, content: str, use_onedrive: bool = True) -> str:
         """Write text content to a file under the chosen base directory."""
-        base = self.settings.ONEDRIVE_BASE_PATH if use_onedrive else self.settings.STORAGE_BASE_PATH
-        full = _safe_join(base, relative_path)
+        full = _safe_join(self._base(use_onedrive), relative_path)
         os.makedirs(os.path.dirname(full), exist_ok=True)
-        with open(full, "w", encoding="utf-8") as f:
-            f.write(content)
+        write_file_bytes(full, content.encode("utf-8"))
         return relative_path
 
+    # PUBLIC_INTERFACE
+    def open_text(self, relative_path: str, use_onedrive: bool = True) -> Tuple[TextIO, os.stat_result]:
+        """
+        Open a file under the chosen base directory for incremental text reads, returning it with its fstat().
+        Raises ValueError on path traversal and FileNotFoundError if the file is missing.
+        """
+        full = _safe_join(self._base(use_onedrive), relative_path)
+        f = open(full, "r", encoding="utf-8")
+        try:
+            return f, os.fstat(f.fileno())
+        except BaseException:
+            f.close()
+            raise
+
+    # PUBLIC_INTERFACE
+    def check_utf8(self, f: TextIO) -> None:
+        """
+        Decode a freshly opened open_text() file end to end in fixed-size blocks (memory stays bounded)
+        and rewind it. Raises UnicodeDecodeError if any part of the file is not valid UTF-8.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        raw = f.buffer
+        while True:
+            block = raw.read(UTF8_CHECK_BLOCK_BYTES)
+            if not block:
+                break
+            decoder.decode(block)
+        decoder.decode(b"", final=True)
+        f.seek(0)
+
+    # PUBLIC_INTERFACE
+    async def aiter_text(self, f: TextIO) -> AsyncIterator[str]:
+        """Yield the remaining text of an open_text() file in chunks (each read in a worker thread), then close it."""
+        try:
+            while True:
+                chunk = await asyncio.to_thread(f.read, STREAM_CHUNK_CHARS)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            f.close()
+
+    # PUBLIC_INTERFACE
+    async def awrite(self, relative_path: str, content: str, use_onedrive: bool = True) -> str:
+        """Async write(): runs the blocking file I/O in a worker thread."""
+        return await asyncio.to_thread(self.write, relative_path, content, use_onedrive)
+
 
 files_repo = FilesRepository()
@@ -1,6 +1,45 @@
+import asyncio
 import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
 
 from ..core.config import get_settings
+from .files_repo import write_file_bytes
+
+# Transcripts are read into pooled scratch buffers of this size and decoded once;
+# larger files spill over into a regular read of the remainder.
+READ_BUFFER_SIZE = 256 * 1024
+_BUF_POOL: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+
+
+def _read_utf8(f) -> str:
+    """
+    Read the rest of an unbuffered binary file and decode it as UTF-8 text, with the same
+    universal-newline handling as open(..., "r").
+    """
+    try:
+        buf = _BUF_POOL.get_nowait()
+    except queue.Empty:
+        buf = bytearray(READ_BUFFER_SIZE)
+    try:
+        with memoryview(buf) as view:
+            n = 0
+            while n < READ_BUFFER_SIZE:
+                got = f.readinto(view[n:])
+                if not got:
+                    break
+                n += got
+            if n < READ_BUFFER_SIZE:
+                text = str(view[:n], "utf-8")
+            else:
+                text = (bytes(view) + f.read()).decode("utf-8")
+    finally:
+        _BUF_POOL.put(buf)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 class InterviewFilesRepository:
@@ -11,41 +50,114 @@ class InterviewFilesRepository:
 
     Notes:
     - The base path is configurable via ONEDRIVE_BASE_PATH.
-    - This repo intentionally does not maintain any in-memory records.
+    - This repo intentionally does not maintain any in-memory records; files are the source
+      of truth. read_text_cached() only keeps a small LRU of file bodies, each validated
+      against the file's current mtime/size before reuse.
     """
 
+    # Max number of transcript bodies kept by read_text_cached()
+    TEXT_CACHE_MAX_ENTRIES = 256
+
     def __init__(self) -> None:
         self.settings = get_settings()
         # Folder name as per requirement
         self.sub_folder_name = "Interview"
+        # Resolve paths once; the folder itself is created lazily on first use
+        self._onedrive_base = self.settings.ONEDRIVE_BASE_PATH
+        self._folder = os.path.join(self._onedrive_base, self.sub_folder_name)
+        self._initialized = False
+        # patient_id -> ((mtime_ns, size), text); guarded by a lock since reads run in worker threads
+        self._text_cache: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
+        self._text_cache_lock = threading.Lock()
 
     def _folder_path(self) -> str:
-        base = self.settings.ONEDRIVE_BASE_PATH
-        # Ensure subdirectory exists
-        path = os.path.join(base, self.sub_folder_name)
-        os.makedirs(path, exist_ok=True)
-        return path
-
-    def _file_path(self, patient_id: str) -> str:
-        safe_name = f"{patient_id}.txt"
+        if not self._initialized:
+            # Ensure subdirectory exists (once per process)
+            os.makedirs(self._folder, exist_ok=True)
+            self._initialized = True
+        return self._folder
+
+    def _file_path(self, patient_id: str, suffix: str = "") -> str:
+        safe_name = f"{patient_id}{suffix}.txt"
         return os.path.join(self._folder_path(), safe_name)
 
+    def _invalidate(self, patient_id: str) -> None:
+        with self._text_cache_lock:
+            self._text_cache.pop(patient_id, None)
+
     # PUBLIC_INTERFACE
-    def write_text(self, patient_id: str, content: str) -> str:
-        """Write interview text to OneDrive Interview folder using patient_id as filename."""
-        full = self._file_path(patient_id)
-        with open(full, "w", encoding="utf-8") as f:
-            f.write(content or "")
+    def write_bytes(self, patient_id: str, data: bytes, suffix: str = "") -> str:
+        """
+        Write already UTF-8 encoded interview text as-is (no decode/re-encode) to the Interview folder.
+        A non-empty suffix writes {patient_id}{suffix}.txt instead, leaving {patient_id}.txt untouched.
+        """
+        full = self._file_path(patient_id, suffix)
+        write_file_bytes(full, data)
+        self._invalidate(patient_id)
         # Return relative path under OneDrive base for reference
-        rel = os.path.relpath(full, self.settings.ONEDRIVE_BASE_PATH)
+        rel = os.path.relpath(full, self._onedrive_base)
         return rel
 
+    # PUBLIC_INTERFACE
+    def write_text(self, patient_id: str, content: str) -> str:
+        """Write interview text to OneDrive Interview folder using patient_id as filename."""
+        return self.write_bytes(patient_id, (content or "").encode("utf-8"))
+
+    # PUBLIC_INTERFACE
+    async def awrite_text(self, patient_id: str, content: str) -> str:
+        """Async write_text(): runs the blocking file I/O in a worker thread."""
+        return await asyncio.to_thread(self.write_text, patient_id, content)
+
+    # PUBLIC_INTERFACE
+    def write_text_many(self, items: Dict[str, str], suffix: str = "") -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """
+        Write several interview transcripts in one call (patient_id -> content), best effort:
+        a failed write does not stop the remaining ones. suffix is passed through to write_bytes().
+        Returns (patient_id -> relative path under the OneDrive base, patient_id -> error).
+        """
+        written: Dict[str, str] = {}
+        failed: Dict[str, Exception] = {}
+        for patient_id, content in items.items():
+            try:
+                written[patient_id] = self.write_bytes(patient_id, (content or "").encode("utf-8"), suffix)
+            except Exception as ex:
+                failed[patient_id] = ex
+        return written, failed
+
     # PUBLIC_INTERFACE
     def read_text(self, patient_id: str) -> str:
         """Read interview text from OneDrive Interview folder."""
-        full = self._file_path(patient_id)
-        with open(full, "r", encoding="utf-8") as f:
-            return f.read()
+        with open(self._file_path(patient_id), "rb", buffering=0) as f:
+            return _read_utf8(f)
+
+    # PUBLIC_INTERFACE
+    def read_text_cached(self, patient_id: str) -> str:
+        """
+        Read interview text, reusing the cached body while the file's mtime and size are unchanged.
+        Raises FileNotFoundError if there is no interview file for the patient.
+        """
+        # Open first and fstat the open handle: a missing file costs one failed open, and the
+        # signature always describes the file we actually read.
+        with open(self._file_path(patient_id), "rb", buffering=0) as f:
+            st = os.fstat(f.fileno())
+            signature = (st.st_mtime_ns, st.st_size)
+            with self._text_cache_lock:
+                cached = self._text_cache.get(patient_id)
+                if cached is not None and cached[0] == signature:
+                    self._text_cache.move_to_end(patient_id)
+                    return cached[1]
+            text = _read_utf8(f)
+        with self._text_cache_lock:
+            self._text_cache[patient_id] = (signature, text)
+            self._text_cache.move_to_end(patient_id)
+            while len(self._text_cache) > self.TEXT_CACHE_MAX_ENTRIES:
+                self._text_cache.popitem(last=False)
+        return text
+
+    # PUBLIC_INTERFACE
+    async def aread_text_cached(self, patient_id: str) -> str:
+        """Async read_text_cached(): runs the open/read in a worker thread."""
+        return await asyncio.to_thread(self.read_text_cached, patient_id)
 
     # PUBLIC_INTERFACE
     def exists(self, patient_id: str) -> bool:
@@ -55,11 +167,12 @@ class InterviewFilesRepository:
     # PUBLIC_INTERFACE
     def delete(self, patient_id: str) -> bool:
         """Delete the interview file for a patient if present."""
-        full = self._file_path(patient_id)
-        if os.path.exists(full):
-            os.remove(full)
-            return True
-        return False
+        try:
+            os.remove(self._file_path(patient_id))
+        except FileNotFoundError:
+            return False
+        self._invalidate(patient_id)
+        return True
 
 
 interview_files_repo = InterviewFilesRepository()
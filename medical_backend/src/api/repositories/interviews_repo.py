@@ -1,9 +1,9 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from secrets import token_hex
 from typing import Dict, List, Optional
-import uuid
 
-from ..models.schemas import Interview, InterviewCreate, ChatTurn
+from ..models.schemas import Interview, InterviewCreate
 
 log = logging.getLogger("app.repo.interviews")
 
@@ -14,12 +14,14 @@ class InterviewsRepository:
     """
     def __init__(self) -> None:
         self._items: Dict[str, Interview] = {}
+        # patient_id -> interview ids (dict used as an insertion-ordered set)
+        self._by_patient: Dict[str, Dict[str, None]] = {}
 
     # PUBLIC_INTERFACE
     def create(self, data: InterviewCreate) -> Interview:
         """Create a new interview session."""
-        now = datetime.utcnow()
-        iid = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
+        iid = token_hex(16)
         interview = Interview(
             id=iid,
             patient_id=data.patient_id,
@@ -30,6 +32,7 @@ class InterviewsRepository:
             transcript=[],
         )
         self._items[iid] = interview
+        self._by_patient.setdefault(data.patient_id, {})[iid] = None
         log.info("Created interview id=%s patient_id=%s", iid, data.patient_id)
         return interview
 
@@ -41,10 +44,9 @@ class InterviewsRepository:
     # PUBLIC_INTERFACE
     def list(self, patient_id: Optional[str] = None) -> List[Interview]:
         """List interviews optionally filtered by patient."""
-        values = list(self._items.values())
         if patient_id:
-            return [x for x in values if x.patient_id == patient_id]
-        return values
+            return [self._items[i] for i in self._by_patient.get(patient_id, ())]
+        return list(self._items.values())
 
     # PUBLIC_INTERFACE
     def add_turn(self, iid: str, role: str, content: str) -> Optional[Interview]:
@@ -52,17 +54,23 @@ class InterviewsRepository:
         interview = self._items.get(iid)
         if not interview:
             return None
-        turn = ChatTurn(role=role, content=content)
-        interview.transcript.append(turn.model_dump())
-        interview.updated_at = datetime.utcnow()
+        # Same shape as ChatTurn.model_dump(), without building a model per turn
+        turn = {"role": role, "content": content, "timestamp": datetime.now(timezone.utc)}
+        interview.transcript.append(turn)
+        interview.updated_at = turn["timestamp"]
         log.info("Interview id=%s appended role=%s", iid, role)
         return interview
 
     # PUBLIC_INTERFACE
     def delete(self, iid: str) -> bool:
         """Delete interview by id."""
-        if iid in self._items:
-            del self._items[iid]
+        interview = self._items.pop(iid, None)
+        if interview is not None:
+            ids = self._by_patient.get(interview.patient_id)
+            if ids is not None:
+                ids.pop(iid, None)
+                if not ids:
+                    del self._by_patient[interview.patient_id]
             log.info("Deleted interview id=%s", iid)
             return True
         return False
@@ -1,7 +1,7 @@
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
-import uuid
+from datetime import datetime, timezone
+from secrets import token_hex
+from typing import Dict, List, Optional, Union
 
 from ..models.schemas import Patient, PatientCreate, PatientUpdate
 
@@ -27,53 +27,70 @@ def _normalize_mrn(mrn: str) -> tuple[str, Optional[int]]:
     return s, None
 
 
+def _mrn_key(mrn: str) -> Union[int, str]:
+    """
+    Build the MRN index key using the normalization rules above.
+    Numeric MRNs map to their integer value (padding-insensitive);
+    non-numeric MRNs map to the exact (stripped) string.
+    """
+    raw, as_int = _normalize_mrn(mrn)
+    return as_int if as_int is not None else raw
+
+
+def _index_key(mrn: Optional[str]) -> Optional[Union[int, str]]:
+    """Index key for an MRN, or None when the MRN is absent or blank (nothing to index)."""
+    if mrn is None or not mrn.strip():
+        return None
+    return _mrn_key(mrn)
+
+
+class DuplicateMRNError(ValueError):
+    """Raised when a create/update would assign an MRN already held by another patient."""
+
+
 class PatientsRepository:
     """
     Simple in-memory repository for patients (replaceable with DB later).
     """
     def __init__(self) -> None:
         self._items: Dict[str, Patient] = {}
-
-    def _mrn_conflicts(self, mrn: str) -> bool:
-        """
-        Check if given MRN would conflict with an existing one using normalization rules.
-        Numeric MRNs are compared by integer value (padding-insensitive).
-        Non-numeric MRNs are compared by exact string.
-        """
-        src_raw, src_int = _normalize_mrn(mrn)
-        for p in self._items.values():
-            if not p.mrn:
-                continue
-            dst_raw, dst_int = _normalize_mrn(p.mrn)
-            if src_int is not None and dst_int is not None:
-                if src_int == dst_int:
-                    return True
-            else:
-                if src_raw == dst_raw:
-                    return True
-        return False
+        # Normalized MRN -> patient id, kept in sync on create/update/delete
+        self._mrn_index: Dict[Union[int, str], str] = {}
+        # Patient id -> its key in _mrn_index (reverse map, so removal never re-derives the key)
+        self._mrn_key_by_pid: Dict[str, Union[int, str]] = {}
+        # Bumped on every mutation; lets readers (ETags) detect changes without comparing records
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter of create/update/delete operations."""
+        return self._version
 
     # PUBLIC_INTERFACE
     def create(self, data: PatientCreate) -> Patient:
         """Create a new patient record."""
-        now = datetime.utcnow()
-        pid = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
+        pid = token_hex(16)
 
         # Duplicate MRN guard if provided (padding-insensitive for numeric MRNs)
         payload = data.model_dump(exclude_none=True)
         mrn = payload.get("mrn")
-        if mrn:
-            if self._mrn_conflicts(mrn):
-                raise ValueError(f"MRN '{mrn}' already exists")
+        mrn_key = _index_key(mrn)
+        if mrn_key is not None and mrn_key in self._mrn_index:
+            raise DuplicateMRNError(f"MRN '{mrn}' already exists")
 
-        # Construct Patient safely from payload
-        item = Patient(
+        # Payload was already validated as PatientCreate; skip a second validation pass
+        item = Patient.model_construct(
             id=pid,
             created_at=now,
             updated_at=now,
             **payload,
         )
         self._items[pid] = item
+        if mrn_key is not None:
+            self._mrn_index[mrn_key] = pid
+            self._mrn_key_by_pid[pid] = mrn_key
+        self._version += 1
         log.info("Created patient id=%s name=%s %s", pid, data.first_name, data.last_name)
         return item
 
@@ -89,18 +106,8 @@ class PatientsRepository:
         - If MRN is numeric, match by integer value, ignoring leading zeros.
         - If MRN is alphanumeric, match by exact string.
         """
-        query_raw, query_int = _normalize_mrn(mrn)
-        for p in self._items.values():
-            if not p.mrn:
-                continue
-            raw, as_int = _normalize_mrn(p.mrn)
-            if query_int is not None and as_int is not None:
-                if query_int == as_int:
-                    return p
-            else:
-                if raw == query_raw:
-                    return p
-        return None
+        pid = self._mrn_index.get(_mrn_key(mrn))
+        return self._items.get(pid) if pid else None
 
     # PUBLIC_INTERFACE
     def list(self) -> List[Patient]:
@@ -117,42 +124,35 @@ class PatientsRepository:
         updates = changes.model_dump(exclude_none=True)
 
         # If MRN is being changed, enforce uniqueness with normalization logic.
-        new_mrn = updates.get("mrn")
-        if new_mrn:
-            # Temporarily remove current item from consideration to allow setting to same MRN
-            # with different padding (e.g., 0001 -> 1) without raising conflict.
-            current = item.mrn
-            conflict = False
-            if current != new_mrn:
-                # Check against others
-                for pid_other, p in self._items.items():
-                    if pid_other == pid:
-                        continue
-                    if not p.mrn:
-                        continue
-                    q_raw, q_int = _normalize_mrn(new_mrn)
-                    r_raw, r_int = _normalize_mrn(p.mrn)
-                    if q_int is not None and r_int is not None:
-                        if q_int == r_int:
-                            conflict = True
-                            break
-                    else:
-                        if q_raw == r_raw:
-                            conflict = True
-                            break
-            if conflict:
-                raise ValueError(f"MRN '{new_mrn}' already exists")
-
-        updated = item.model_copy(update={**updates, "updated_at": datetime.utcnow()})
+        # Re-setting the same MRN with different padding (e.g., 0001 -> 1) is not a conflict;
+        # an empty/blank MRN removes it from the index.
+        old_key = self._mrn_key_by_pid.get(pid)
+        new_key = _index_key(updates["mrn"]) if "mrn" in updates else old_key
+        if new_key is not None and new_key != old_key and new_key in self._mrn_index:
+            raise DuplicateMRNError(f"MRN '{updates['mrn']}' already exists")
+
+        updated = item.model_copy(update={**updates, "updated_at": datetime.now(timezone.utc)})
         self._items[pid] = updated
+        if new_key != old_key:
+            if old_key is not None:
+                self._mrn_index.pop(old_key, None)
+                del self._mrn_key_by_pid[pid]
+            if new_key is not None:
+                self._mrn_index[new_key] = pid
+                self._mrn_key_by_pid[pid] = new_key
+        self._version += 1
         log.info("Updated patient id=%s", pid)
         return updated
 
     # PUBLIC_INTERFACE
     def delete(self, pid: str) -> bool:
         """Delete patient by id."""
-        if pid in self._items:
-            del self._items[pid]
+        item = self._items.pop(pid, None)
+        if item is not None:
+            mrn_key = self._mrn_key_by_pid.pop(pid, None)
+            if mrn_key is not None:
+                self._mrn_index.pop(mrn_key, None)
+            self._version += 1
             log.info("Deleted patient id=%s", pid)
             return True
         return False
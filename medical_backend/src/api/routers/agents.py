@@ -17,10 +17,14 @@ async def agent_advisor_run(
     max_items: int = Query(3, ge=1, le=10),
 ) -> Dict[str, Any]:
     """Run advisor on file-based interview text."""
-    if not interview_files_repo.exists(patient_id):
+    try:
+        text = await interview_files_repo.aread_text_cached(patient_id)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Interview file not found")
+    except (OSError, ValueError) as ex:
+        # Unreadable or non-UTF-8 transcript (UnicodeDecodeError is a ValueError)
+        raise HTTPException(status_code=500, detail=f"Advisor failed: {ex}")
     try:
-        text = interview_files_repo.read_text(patient_id)
         return await orchestrator.run_advisor_on_text(patient_id, text, max_items=max_items)
     except Exception as ex:
         raise HTTPException(status_code=500, detail=f"Advisor failed: {ex}")
@@ -37,7 +41,11 @@ async def crew_run(
     max_items: int = Query(3, ge=1, le=10),
 ) -> Dict[str, Any]:
     """Run a simple crew workflow using file-based interview text (advisor only at present)."""
-    if not interview_files_repo.exists(patient_id):
+    try:
+        text = await interview_files_repo.aread_text_cached(patient_id)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Interview file not found")
-    text = interview_files_repo.read_text(patient_id)
+    except (OSError, ValueError) as ex:
+        # Unreadable or non-UTF-8 transcript (UnicodeDecodeError is a ValueError)
+        raise HTTPException(status_code=500, detail=f"Advisor failed: {ex}")
     return await orchestrator.run_advisor_on_text(patient_id, text, max_items=max_items)
@@ -1,30 +1,81 @@
-from fastapi import APIRouter, Query, HTTPException
+import asyncio
+from typing import AsyncIterator, Dict, Union
+
+import orjson
+from fastapi import APIRouter, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+from ..core.http_cache import etag_matches, not_modified
 from ..models.schemas import FileWriteRequest, FileReadResponse, OperationStatus
 from ..repositories.files_repo import files_repo
 
 router = APIRouter(prefix="/files", tags=["files"])
 
 
-@router.post("/write", response_model=OperationStatus, summary="Write file", description="Write a text file under OneDrive or local storage.")
+async def _json_wrap(relative_path: str, chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """
+    Emit {"relative_path": ..., "content": ...} incrementally: each text chunk is JSON-escaped
+    on its own (orjson output minus the surrounding quotes), so memory stays bounded by the chunk size.
+    """
+    yield b'{"relative_path":' + orjson.dumps(relative_path) + b',"content":"'
+    async for chunk in chunks:
+        yield orjson.dumps(chunk)[1:-1]
+    yield b'"}'
+
+
+# Responses below are plain dicts of a fixed shape; the models only document them in OpenAPI.
+@router.post(
+    "/write",
+    response_model=None,
+    responses={200: {"model": OperationStatus}},
+    summary="Write file",
+    description="Write a text file under OneDrive or local storage.",
+)
 # PUBLIC_INTERFACE
-def write_file(payload: FileWriteRequest, use_onedrive: bool = Query(True, description="Write under OneDrive base path")) -> OperationStatus:
+async def write_file(payload: FileWriteRequest, use_onedrive: bool = Query(True, description="Write under OneDrive base path")) -> Dict[str, str]:
     """Write text content to a file."""
     try:
-        rel = files_repo.write(payload.relative_path, payload.content, use_onedrive=use_onedrive)
-        return OperationStatus(status="ok", detail=f"wrote:{rel}")
+        rel = await files_repo.awrite(payload.relative_path, payload.content, use_onedrive=use_onedrive)
+        return {"status": "ok", "detail": f"wrote:{rel}"}
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
 
 
-@router.get("/read", response_model=FileReadResponse, summary="Read file", description="Read a text file under OneDrive or local storage.")
+@router.get(
+    "/read",
+    response_model=None,
+    responses={200: {"model": FileReadResponse}},
+    summary="Read file",
+    description="Read a text file under OneDrive or local storage.",
+)
 # PUBLIC_INTERFACE
-def read_file(relative_path: str = Query(..., description="Relative path under base folder"),
-              use_onedrive: bool = Query(True, description="Read from OneDrive base path")) -> FileReadResponse:
-    """Read text content from a file."""
+async def read_file(request: Request,
+                    relative_path: str = Query(..., description="Relative path under base folder"),
+                    use_onedrive: bool = Query(True, description="Read from OneDrive base path")) -> Union[StreamingResponse, Response]:
+    """Read text content from a file, streamed in chunks."""
+    # Open, stat and check the whole file decodes before streaming, so a missing file, bad path or
+    # non-UTF-8 content anywhere in the file still gets a proper 404/400 instead of a truncated 200
     try:
-        rel, content = files_repo.read(relative_path, use_onedrive=use_onedrive)
-        return FileReadResponse(relative_path=rel, content=content)
+        f, st = await asyncio.to_thread(files_repo.open_text, relative_path, use_onedrive)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
+    # Weak validator from the open file's size and mtime; a match skips reading and encoding entirely
+    etag = f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"'
+    if etag_matches(request, etag):
+        f.close()
+        return not_modified(etag)
+    try:
+        await asyncio.to_thread(files_repo.check_utf8, f)
+    except UnicodeDecodeError as ude:
+        f.close()
+        raise HTTPException(status_code=400, detail=str(ude))
+    except BaseException:
+        f.close()
+        raise
+    return StreamingResponse(
+        _json_wrap(relative_path, files_repo.aiter_text(f)),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
@@ -1,6 +1,7 @@
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException, Path, Body
+from typing import Dict, Any, Optional, Type, TypeVar
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from fastapi import APIRouter, HTTPException, Path, Request
+from fastapi.exceptions import RequestValidationError
 
 from ..services.interview_session_service import interview_session_service
 
@@ -9,26 +10,80 @@ router = APIRouter(prefix="/interview-session", tags=["interview-session"])
 
 class StartSessionRequest(BaseModel):
     """Request body for starting an interview session."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     chief_complaint: Optional[str] = Field(None, description="Chief complaint to seed interview.")
     context: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional context for the agent.")
 
 
 class AnswerRequest(BaseModel):
     """Request body for submitting an answer."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     answer: str = Field(..., description="Patient's natural language response.")
 
 
+# Body models parsed by hand below; FastAPI cannot see them, so build_openapi_schema() registers
+# them under components.schemas for the requestBody $refs.
+BODY_MODELS = (StartSessionRequest, AnswerRequest)
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _json_body_doc(model: Type[BaseModel], required: bool) -> Dict[str, Any]:
+    """OpenAPI requestBody for handlers that parse their body from the raw request (model must be in BODY_MODELS)."""
+    return {
+        "requestBody": {
+            "required": required,
+            "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/{model.__name__}"}}},
+        }
+    }
+
+
+def _require_json(request: Request) -> None:
+    """
+    Reject bodies not declared as JSON (application/json or application/*+json), as FastAPI's own
+    body parsing does. This also keeps CORS "simple" content types (text/plain, form posts),
+    which skip the preflight, from reaching the session endpoints cross-site.
+    """
+    media_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    maintype, _, subtype = media_type.partition("/")
+    if maintype != "application" or (subtype != "json" and not subtype.endswith("+json")):
+        raise HTTPException(status_code=415, detail="Content-Type must be application/json")
+
+
+def _parse_body(model: Type[_M], raw: bytes) -> _M:
+    """
+    Validate a raw JSON body with pydantic's JSON parser in one pass (no intermediate dict),
+    reporting failures in FastAPI's usual 422 format.
+    """
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
+
 @router.post(
     "/{patient_id}/start",
     summary="Start patient interview session",
     description="Begin an agent-driven interview session. Returns initial questions by the agent. This is the only supported way to create interviews.",
+    openapi_extra=_json_body_doc(StartSessionRequest, required=False),
 )
 # PUBLIC_INTERFACE
 async def start_session(
+    request: Request,
     patient_id: str = Path(..., description="Target patient id"),
-    payload: StartSessionRequest = Body(default_factory=StartSessionRequest),
 ) -> Dict[str, Any]:
     """Start an interview session and receive initial questions."""
+    raw = await request.body()
+    # Only an absent body falls back to the defaults; anything sent must be JSON
+    if raw:
+        _require_json(request)
+        payload = _parse_body(StartSessionRequest, raw)
+    else:
+        payload = StartSessionRequest()
     try:
         res = await interview_session_service.start_session(
             patient_id=patient_id,
@@ -44,13 +99,16 @@ async def start_session(
     "/{patient_id}/answer",
     summary="Submit answer and get next question(s)",
     description="Submit the patient's answer to the last question and receive the agent's next question(s).",
+    openapi_extra=_json_body_doc(AnswerRequest, required=True),
 )
 # PUBLIC_INTERFACE
 async def submit_answer(
+    request: Request,
     patient_id: str = Path(..., description="Target patient id"),
-    payload: AnswerRequest = Body(...),
 ) -> Dict[str, Any]:
     """Submit an answer and get adaptive follow-up question(s)."""
+    _require_json(request)
+    payload = _parse_body(AnswerRequest, await request.body())
     try:
         res = await interview_session_service.submit_answer(patient_id, payload.answer)
         return res
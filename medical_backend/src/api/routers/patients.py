@@ -1,11 +1,26 @@
-from typing import List
-from fastapi import APIRouter, HTTPException
+from secrets import token_hex
+from typing import Dict, List, Union
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 
+from ..core.http_cache import etag_matches, not_modified
 from ..models.schemas import Patient, PatientCreate, PatientUpdate, OperationStatus
-from ..repositories.patients_repo import patients_repo
+from ..repositories.patients_repo import DuplicateMRNError, patients_repo
 
 router = APIRouter(prefix="/patients", tags=["patients"])
 
+# Fixed delete response; serialized as-is (OperationStatus documents it in OpenAPI)
+_OK_DELETED: Dict[str, str] = {"status": "ok", "detail": "deleted"}
+
+
+# The in-memory repo (and its version counter) restarts with the process; the epoch keeps old ETags from matching
+_ETAG_EPOCH = token_hex(4)
+
+
+def _repo_etag() -> str:
+    # Any create/update/delete bumps the repo version, so it validates both list and single-patient reads
+    return f'W/"{_ETAG_EPOCH}-{patients_repo.version:x}"'
+
 
 @router.post(
     "",
@@ -19,19 +34,25 @@ def create_patient(payload: PatientCreate) -> Patient:
     """Create a patient."""
     try:
         return patients_repo.create(payload)
+    except DuplicateMRNError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as ve:
-        # Detect MRN duplicate message and return 409 Conflict; otherwise 400 Bad Request
-        detail = str(ve)
-        if "already exists" in detail and "MRN" in detail:
-            raise HTTPException(status_code=409, detail=detail)
-        raise HTTPException(status_code=400, detail=detail)
+        raise HTTPException(status_code=400, detail=str(ve))
 
 
 @router.get("", response_model=List[Patient], summary="List patients", description="List all patients.")
 # PUBLIC_INTERFACE
-def list_patients() -> List[Patient]:
+async def list_patients(request: Request) -> Response:
     """List patients."""
-    return patients_repo.list()
+    etag = _repo_etag()
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    # Stored records are already valid Patient models; dump them directly instead of having
+    # FastAPI re-validate every item against response_model (kept for the OpenAPI schema).
+    return ORJSONResponse(
+        content=[p.model_dump(mode="json") for p in patients_repo.list()],
+        headers={"ETag": etag},
+    )
 
 
 @router.get(
@@ -41,7 +62,7 @@ def list_patients() -> List[Patient]:
     description="Retrieve a patient using Medical Record Number (padding-insensitive for numeric MRNs).",
 )
 # PUBLIC_INTERFACE
-def get_patient_by_mrn(mrn: str) -> Patient:
+async def get_patient_by_mrn(mrn: str) -> Patient:
     """
     Get patient by MRN.
 
@@ -57,11 +78,15 @@ def get_patient_by_mrn(mrn: str) -> Patient:
 
 @router.get("/{patient_id}", response_model=Patient, summary="Get patient", description="Retrieve a patient by ID.")
 # PUBLIC_INTERFACE
-def get_patient(patient_id: str) -> Patient:
+async def get_patient(patient_id: str, request: Request, response: Response) -> Union[Patient, Response]:
     """Get patient by ID."""
+    etag = _repo_etag()
     res = patients_repo.get(patient_id)
     if not res:
         raise HTTPException(status_code=404, detail="Patient not found")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return res
 
 
@@ -71,21 +96,26 @@ def update_patient(patient_id: str, payload: PatientUpdate) -> Patient:
     """Update a patient."""
     try:
         res = patients_repo.update(patient_id, payload)
+    except DuplicateMRNError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as ve:
-        detail = str(ve)
-        if "already exists" in detail and "MRN" in detail:
-            raise HTTPException(status_code=409, detail=detail)
-        raise HTTPException(status_code=400, detail=detail)
+        raise HTTPException(status_code=400, detail=str(ve))
     if not res:
         raise HTTPException(status_code=404, detail="Patient not found")
     return res
 
 
-@router.delete("/{patient_id}", response_model=OperationStatus, summary="Delete patient", description="Delete a patient.")
+@router.delete(
+    "/{patient_id}",
+    response_model=None,
+    responses={200: {"model": OperationStatus}},
+    summary="Delete patient",
+    description="Delete a patient.",
+)
 # PUBLIC_INTERFACE
-def delete_patient(patient_id: str) -> OperationStatus:
+def delete_patient(patient_id: str) -> Dict[str, str]:
     """Delete a patient."""
     ok = patients_repo.delete(patient_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Patient not found")
-    return OperationStatus(status="ok", detail="deleted")
+    return _OK_DELETED
@@ -1,10 +1,71 @@
+import hashlib
 import logging
-from typing import List, Dict, Any
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
+from ..core.config import get_settings
 from .vector_client import vector_client
 
 log = logging.getLogger("app.agents")
 
+# Bit flags for follow-up topics the interview agent has already asked about
+TOPIC_DURATION = 1
+TOPIC_SEVERITY = 2
+TOPIC_TRIGGERS = 4
+_TOPIC_KEYWORDS = (
+    (TOPIC_DURATION, "duration"),
+    (TOPIC_SEVERITY, "severity"),
+    (TOPIC_TRIGGERS, "triggers"),
+)
+
+
+# PUBLIC_INTERFACE
+def topic_mask(text: str) -> int:
+    """Return the TOPIC_* bits whose keyword appears in the given agent message (case-insensitive)."""
+    lowered = text.lower()
+    mask = 0
+    for bit, keyword in _TOPIC_KEYWORDS:
+        if keyword in lowered:
+            mask |= bit
+    return mask
+
+
+# Advisor suggestion templates ({:.300} truncates the snippet while formatting)
+_TITLE_FMT = "Suggestion #{}"
+_RATIONALE_FMT = "Based on retrieved evidence: {:.300}..."
+
+
+def _clamp_unit(x: float) -> float:
+    """Clamp a score to [0, 1] without the two builtin calls of min(max(...))."""
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+def _copy_suggestions(suggestions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy suggestion dicts (and their citation lists) so cached entries cannot be mutated by callers."""
+    return [{**s, "citations": list(s["citations"])} for s in suggestions]
+
+
+@lru_cache(maxsize=1024)
+def _question_plan(chief_complaint: str, asked_mask: int) -> Tuple[str, ...]:
+    """
+    Follow-up questions for a complaint given the topics already asked.
+    The rules depend on nothing else, so plans are memoized per (complaint, mask).
+    """
+    questions: List[str] = []
+    if not asked_mask & TOPIC_DURATION:
+        questions.append("How long have you been experiencing this issue?")
+    if not asked_mask & TOPIC_SEVERITY:
+        questions.append("How severe are your symptoms on a scale from 1 to 10?")
+    if not asked_mask & TOPIC_TRIGGERS:
+        questions.append("Have you noticed any triggers or patterns that make it better or worse?")
+    if chief_complaint:
+        questions.append(f"Can you describe more details about: {chief_complaint}?")
+    if not questions:
+        questions.append("Do you have any other symptoms or concerns you'd like to share?")
+    return tuple(questions)
+
 
 class PatientInterviewAgent:
     """
@@ -14,49 +75,73 @@ class PatientInterviewAgent:
     """
 
     # PUBLIC_INTERFACE
-    async def next_questions(self, chief_complaint: str, transcript: List[Dict[str, Any]]) -> List[str]:
-        """Generate next set of patient questions."""
-        log.info("InterviewAgent generating questions. CC='%s' turns=%d", chief_complaint, len(transcript))
-        asked = " ".join([t.get("content", "").lower() for t in transcript if t.get("role") == "agent"])
-        questions: List[str] = []
-        if "duration" not in asked:
-            questions.append("How long have you been experiencing this issue?")
-        if "severity" not in asked:
-            questions.append("How severe are your symptoms on a scale from 1 to 10?")
-        if "triggers" not in asked:
-            questions.append("Have you noticed any triggers or patterns that make it better or worse?")
-        if chief_complaint:
-            questions.append(f"Can you describe more details about: {chief_complaint}?")
-        if not questions:
-            questions.append("Do you have any other symptoms or concerns you'd like to share?")
-        return questions
+    async def next_questions(
+        self,
+        chief_complaint: str,
+        transcript: Sequence[Any],
+        asked_mask: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate next set of patient questions.
+
+        transcript holds turn dicts or objects with role/content attributes (InterviewSession's Turn).
+        asked_mask is the OR of topic_mask() over the agent turns so far; callers that track it
+        incrementally (InterviewSession) pass it in, otherwise it is derived from the transcript.
+        """
+        # Level checked per call (logging is configured after import); skips len() and arg packing when off
+        if log.isEnabledFor(logging.INFO):
+            log.info("InterviewAgent generating questions. CC='%s' turns=%d", chief_complaint, len(transcript))
+        if asked_mask is None:
+            asked_mask = 0
+            for t in transcript:
+                if isinstance(t, dict):
+                    role, content = t.get("role"), t.get("content", "")
+                else:
+                    role, content = t.role, t.content
+                if role == "agent":
+                    asked_mask |= topic_mask(content)
+        # Fresh list per call; the cached plan itself is an immutable tuple
+        return list(_question_plan(chief_complaint, asked_mask))
 
 
 class MedicalAdvisorAgent:
     """
     Medical Advisor Agent with RAG:
     - Uses vector database to retrieve guideline snippets and generate suggestions.
+    - Suggestions backed by evidence are memoized per (transcript hash, max_items) for a short TTL,
+      so repeated runs over the same transcript skip the vector DB round-trip
+      (ADVISOR_CACHE_TTL_SECS / ADVISOR_CACHE_MAX_ENTRIES; fallback results are never cached).
     """
 
+    def __init__(self) -> None:
+        self.settings = get_settings()
+        # (blake2b digest, max_items) -> (expires_at monotonic, suggestions)
+        self._advise_cache: "OrderedDict[Tuple[bytes, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+
     # PUBLIC_INTERFACE
     async def advise(self, interview_text: str, max_items: int = 3) -> List[Dict[str, Any]]:
         """Return structured suggestions with rationale and citations."""
-        log.info("AdvisorAgent analyzing interview. length=%d", len(interview_text))
+        if log.isEnabledFor(logging.INFO):
+            log.info("AdvisorAgent analyzing interview. length=%d", len(interview_text))
+        key = (hashlib.blake2b(interview_text.encode("utf-8"), digest_size=16).digest(), max_items)
+        now = time.monotonic()
+        cached = self._advise_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                self._advise_cache.move_to_end(key)
+                return _copy_suggestions(cached[1])
+            del self._advise_cache[key]
+
         results = await vector_client.query(interview_text, top_k=max(5, max_items * 2))
-        suggestions: List[Dict[str, Any]] = []
-        for idx, item in enumerate(results[:max_items]):
-            title = f"Suggestion #{idx+1}"
-            rationale = f"Based on retrieved evidence: {item.get('text','')[:300]}..."
-            citations = [item.get("source", "guideline")]
-            confidence = float(item.get("score", 0.5))
-            suggestions.append(
-                {
-                    "title": title,
-                    "rationale": rationale,
-                    "citations": citations,
-                    "confidence": min(max(confidence, 0.0), 1.0),
-                }
-            )
+        suggestions: List[Dict[str, Any]] = [
+            {
+                "title": _TITLE_FMT.format(idx),
+                "rationale": _RATIONALE_FMT.format(item.get("text", "")),
+                "citations": [item.get("source", "guideline")],
+                "confidence": _clamp_unit(float(item.get("score", 0.5))),
+            }
+            for idx, item in enumerate(results[:max_items], start=1)
+        ]
         if not suggestions:
             suggestions.append(
                 {
@@ -66,6 +151,15 @@ class MedicalAdvisorAgent:
                     "confidence": 0.2,
                 }
             )
+            return suggestions
+
+        max_entries = self.settings.ADVISOR_CACHE_MAX_ENTRIES
+        if max_entries <= 0:
+            return suggestions
+        self._advise_cache[key] = (now + self.settings.ADVISOR_CACHE_TTL_SECS, _copy_suggestions(suggestions))
+        self._advise_cache.move_to_end(key)
+        while len(self._advise_cache) > max_entries:
+            self._advise_cache.popitem(last=False)
         return suggestions
 
 
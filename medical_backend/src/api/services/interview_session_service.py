@@ -1,13 +1,34 @@
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-
-from ..services.agents import patient_interview_agent
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, List, Optional
+from datetime import datetime, timedelta, timezone
+
+from ..core.config import get_settings
+from ..services.agents import patient_interview_agent, topic_mask
 from ..repositories.interview_files_repo import interview_files_repo
 
 log = logging.getLogger("app.interview.session")
 
 
+def _iso_z(dt: datetime) -> str:
+    """Format an aware UTC datetime as ISO-8601 with a 'Z' suffix (always with microseconds)."""
+    return dt.isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+@dataclass(slots=True)
+class Turn:
+    """One transcript entry; slotted to keep long transcripts compact."""
+    role: str
+    content: str
+    timestamp: str
+
+    def as_dict(self) -> Dict[str, str]:
+        return {"role": self.role, "content": self.content, "timestamp": self.timestamp}
+
+
 class InterviewSession:
     """
     Represents a single agent-driven interview session for a patient.
@@ -16,45 +37,61 @@ class InterviewSession:
     - role: 'agent' or 'patient'
     - content: text
     - timestamp: ISO string
+    stored as Turn objects; API responses get plain dicts via transcript_dicts().
     """
     def __init__(self, patient_id: str, chief_complaint: Optional[str] = None, context: Optional[Dict[str, Any]] = None):
         self.patient_id = patient_id
         self.chief_complaint = (chief_complaint or "").strip()
         self.context = context or {}
-        self.created_at = datetime.utcnow()
+        self.created_at = datetime.now(timezone.utc)
         self.updated_at = self.created_at
         self.completed = False
-        self.transcript: List[Dict[str, Any]] = []
+        self.transcript: List[Turn] = []
+        # Rendered "[ts] ROLE: content" line per turn, appended alongside transcript for to_text()
+        self._lines: List[str] = []
+        # OR of agents.topic_mask() over agent turns, maintained as turns are appended
+        self.asked_mask = 0
 
     def append_turn(self, role: str, content: str) -> None:
         """Append a turn and update timestamp."""
-        self.transcript.append(
-            {
-                "role": role,
-                "content": content,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-            }
-        )
-        self.updated_at = datetime.utcnow()
+        # One clock read per turn: the turn timestamp and updated_at always agree
+        now = datetime.now(timezone.utc)
+        turn = Turn(role, content, _iso_z(now))
+        self.transcript.append(turn)
+        self._lines.append(f"[{turn.timestamp}] {role.upper()}: {content}")
+        self.updated_at = now
+        if role == "agent":
+            self.asked_mask |= topic_mask(content)
+
+    def transcript_dicts(self) -> List[Dict[str, str]]:
+        """Transcript as JSON-ready dicts (role/content/timestamp), the shape returned by the API."""
+        return [t.as_dict() for t in self.transcript]
 
     def to_text(self) -> str:
         """Return a readable transcript suitable for saving to a .txt file."""
-        lines: List[str] = []
-        header = [
-            "Patient Interview Transcript",
-            f"Patient ID: {self.patient_id}",
-            f"Chief Complaint: {self.chief_complaint}",
-            f"Created: {self.created_at.isoformat()}Z",
-            f"Updated: {self.updated_at.isoformat()}Z",
-            "-" * 60,
-        ]
-        lines.extend(header)
-        for t in self.transcript:
-            role = t.get("role", "agent").upper()
-            ts = t.get("timestamp", "")
-            content = t.get("content", "")
-            lines.append(f"[{ts}] {role}: {content}")
-        return "\n".join(lines)
+        header = "\n".join(
+            (
+                "Patient Interview Transcript",
+                f"Patient ID: {self.patient_id}",
+                f"Chief Complaint: {self.chief_complaint}",
+                f"Created: {_iso_z(self.created_at)}",
+                f"Updated: {_iso_z(self.updated_at)}",
+                "-" * 60,
+            )
+        )
+        if not self._lines:
+            return header
+        # Turns were formatted once at append time; only the join is repeated
+        return f"{header}\n" + "\n".join(self._lines)
+
+
+class _PatientLock:
+    """asyncio.Lock plus the number of coroutines holding or waiting on it (for cleanup)."""
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
 
 
 class InterviewSessionService:
@@ -65,82 +102,153 @@ class InterviewSessionService:
     - start_session(patient_id, chief_complaint?, context?) -> creates session if not present and returns first question(s)
     - submit_answer(patient_id, answer) -> appends patient answer and returns next question(s)
     - end_session(patient_id) -> marks complete, writes transcript to OneDrive/Interview/{patient_id}.txt, clears session
+
+    Abandoned sessions are bounded: when a new session starts, sessions idle for longer than
+    INTERVIEW_SESSION_IDLE_TTL_SECS, and the least recently used ones beyond INTERVIEW_SESSION_MAX_ACTIVE,
+    are evicted and their transcripts written to OneDrive as if the session had been ended.
     """
     def __init__(self):
-        # In-memory sessions keyed by patient_id
-        self._sessions: Dict[str, InterviewSession] = {}
+        self.settings = get_settings()
+        # In-memory sessions keyed by patient_id, least recently used first
+        self._sessions: "OrderedDict[str, InterviewSession]" = OrderedDict()
+        # Per-patient locks serialize session operations; entries are dropped once unused
+        self._locks: Dict[str, _PatientLock] = {}
+
+    @asynccontextmanager
+    async def _patient_lock(self, patient_id: str) -> AsyncIterator[None]:
+        # No await between lookup and insert, so the event loop cannot interleave two creations
+        entry = self._locks.get(patient_id)
+        if entry is None:
+            entry = self._locks[patient_id] = _PatientLock()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[patient_id]
+
+    def _evict_stale(self, incoming: int = 1) -> List[InterviewSession]:
+        """
+        Remove idle sessions and, to make room for `incoming` new ones, least recently used sessions
+        beyond the cap. Sessions of patients with an operation in progress (lock held) are never evicted.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.settings.INTERVIEW_SESSION_IDLE_TTL_SECS)
+        over = len(self._sessions) + incoming - self.settings.INTERVIEW_SESSION_MAX_ACTIVE
+        stale: List[str] = []
+        for pid, session in self._sessions.items():
+            if over <= 0 and session.updated_at > cutoff:
+                break
+            if pid in self._locks:
+                continue
+            stale.append(pid)
+            over -= 1
+        return [self._sessions.pop(pid) for pid in stale]
+
+    def _persist_evicted(self, sessions: List[InterviewSession]) -> None:
+        """
+        Save transcripts of evicted sessions the patient actually answered in. They go to
+        {patient_id}.evicted-<UTC timestamp>.txt so an abandoned session never replaces the
+        transcript saved by /end (which the advisor reads).
+        """
+        answered = {}
+        for session in sessions:
+            session.completed = True
+            if any(t.role == "patient" for t in session.transcript):
+                answered[session.patient_id] = session.to_text()
+        if not answered:
+            return
+        suffix = ".evicted-" + datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        written, failed = interview_files_repo.write_text_many(answered, suffix)
+        for patient_id, rel_path in written.items():
+            log.info("Evicted idle interview session patient_id=%s; transcript saved to %s", patient_id, rel_path)
+        for patient_id, ex in failed.items():
+            log.error("Failed to save transcript of evicted session patient_id=%s", patient_id, exc_info=ex)
 
     # PUBLIC_INTERFACE
     async def start_session(self, patient_id: str, chief_complaint: Optional[str], context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Start an interview session for the patient, returning initial agent question(s)."""
-        if patient_id in self._sessions and not self._sessions[patient_id].completed:
-            # If session exists and still running, return a warning but continue by generating next questions
-            log.info("Session already active for patient_id=%s; generating next questions", patient_id)
-            session = self._sessions[patient_id]
-        else:
-            session = InterviewSession(patient_id=patient_id, chief_complaint=chief_complaint, context=context)
-            self._sessions[patient_id] = session
-            log.info("Started new interview session for patient_id=%s", patient_id)
-
-        # Generate first/next questions based on current transcript
-        questions = await patient_interview_agent.next_questions(session.chief_complaint, session.transcript)
-        # Record agent questions as a single agent turn (can also split into multiple turns)
-        for q in questions:
-            session.append_turn("agent", q)
-
-        return {
-            "patient_id": patient_id,
-            "completed": session.completed,
-            "questions": questions,
-            "transcript": session.transcript,
-        }
+        async with self._patient_lock(patient_id):
+            if patient_id in self._sessions and not self._sessions[patient_id].completed:
+                # If session exists and still running, return a warning but continue by generating next questions
+                log.info("Session already active for patient_id=%s; generating next questions", patient_id)
+                session = self._sessions[patient_id]
+                self._sessions.move_to_end(patient_id)
+            else:
+                evicted = self._evict_stale()
+                if evicted:
+                    await asyncio.to_thread(self._persist_evicted, evicted)
+                session = InterviewSession(patient_id=patient_id, chief_complaint=chief_complaint, context=context)
+                self._sessions[patient_id] = session
+                log.info("Started new interview session for patient_id=%s", patient_id)
+
+            # Generate first/next questions based on current transcript
+            questions = await patient_interview_agent.next_questions(
+                session.chief_complaint, session.transcript, asked_mask=session.asked_mask
+            )
+            # Record agent questions as a single agent turn (can also split into multiple turns)
+            for q in questions:
+                session.append_turn("agent", q)
+
+            return {
+                "patient_id": patient_id,
+                "completed": session.completed,
+                "questions": questions,
+                "transcript": session.transcript_dicts(),
+            }
 
     # PUBLIC_INTERFACE
     async def submit_answer(self, patient_id: str, answer: str) -> Dict[str, Any]:
         """Submit a patient's answer and return the next agent question(s)."""
-        session = self._sessions.get(patient_id)
-        if not session or session.completed:
-            raise ValueError("No active session for this patient.")
-
-        # Append patient turn
-        session.append_turn("patient", answer or "")
-
-        # Generate follow-up question(s)
-        questions = await patient_interview_agent.next_questions(session.chief_complaint, session.transcript)
-        if not questions:
-            # If no more questions, advise session to be ended by caller
-            log.info("No additional questions generated for patient_id=%s", patient_id)
-        else:
-            for q in questions:
-                session.append_turn("agent", q)
-
-        return {
-            "patient_id": patient_id,
-            "completed": session.completed,
-            "questions": questions,
-            "transcript": session.transcript,
-        }
+        async with self._patient_lock(patient_id):
+            session = self._sessions.get(patient_id)
+            if not session or session.completed:
+                raise ValueError("No active session for this patient.")
+            self._sessions.move_to_end(patient_id)
+
+            # Append patient turn
+            session.append_turn("patient", answer or "")
+
+            # Generate follow-up question(s)
+            questions = await patient_interview_agent.next_questions(
+                session.chief_complaint, session.transcript, asked_mask=session.asked_mask
+            )
+            if not questions:
+                # If no more questions, advise session to be ended by caller
+                log.info("No additional questions generated for patient_id=%s", patient_id)
+            else:
+                for q in questions:
+                    session.append_turn("agent", q)
+
+            return {
+                "patient_id": patient_id,
+                "completed": session.completed,
+                "questions": questions,
+                "transcript": session.transcript_dicts(),
+            }
 
     # PUBLIC_INTERFACE
     async def end_session(self, patient_id: str) -> Dict[str, Any]:
         """End the session, write transcript to OneDrive as {patient_id}.txt, and return status."""
-        session = self._sessions.get(patient_id)
-        if not session:
-            raise ValueError("No session found for this patient.")
+        async with self._patient_lock(patient_id):
+            session = self._sessions.get(patient_id)
+            if not session:
+                raise ValueError("No session found for this patient.")
 
-        if session.completed:
-            log.info("Session already completed for patient_id=%s", patient_id)
+            if session.completed:
+                log.info("Session already completed for patient_id=%s", patient_id)
 
-        session.completed = True
-        # Render to text and write to OneDrive Interview/{patient_id}.txt
-        text = session.to_text()
-        rel_path = interview_files_repo.write_text(patient_id, text)
-        log.info("Wrote interview transcript to OneDrive: %s", rel_path)
+            session.completed = True
+            # Render to text and write to OneDrive Interview/{patient_id}.txt
+            text = session.to_text()
+            rel_path = await interview_files_repo.awrite_text(patient_id, text)
+            log.info("Wrote interview transcript to OneDrive: %s", rel_path)
 
-        # Optionally, clear from memory after completion to avoid leaks
-        del self._sessions[patient_id]
+            # Optionally, clear from memory after completion to avoid leaks
+            del self._sessions[patient_id]
 
-        return {"status": "ok", "detail": f"transcript_written:{rel_path}", "patient_id": patient_id}
+            return {"status": "ok", "detail": f"transcript_written:{rel_path}", "patient_id": patient_id}
 
 
 interview_session_service = InterviewSessionService()
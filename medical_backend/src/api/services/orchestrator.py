@@ -10,25 +10,20 @@ class MedicalOrchestrator:
     """
     Orchestrates the agent workflow.
 
-    Legacy methods using in-memory interviews are retained for compatibility,
-    but the new file-based flow should prefer run_advisor_on_text().
+    The in-memory interview methods (run_interview_step, run_advisor) have been removed;
+    use run_advisor_on_text() with the file-based transcript.
     """
 
-    # PUBLIC_INTERFACE
-    async def run_interview_step(self, interview_id: str) -> Dict[str, Any]:
-        """
-        Deprecated: In-memory interview question generation.
-        Kept for backward compatibility if any callers still use it.
-        """
-        raise ValueError("Interview flow is now file-based; run_interview_step is deprecated.")
+    # Removed in-memory interview methods, reported with a pointer to the replacement
+    _REMOVED = frozenset({"run_interview_step", "run_advisor"})
 
-    # PUBLIC_INTERFACE
-    async def run_advisor(self, interview_id: str, max_items: int = 3) -> Dict[str, Any]:
-        """
-        Deprecated: In-memory transcript advisor.
-        Kept for backward compatibility if any callers still use it.
-        """
-        raise ValueError("Interview flow is now file-based; run_advisor is deprecated.")
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes that do not exist; normal lookups never get here
+        if name in MedicalOrchestrator._REMOVED:
+            raise AttributeError(
+                f"MedicalOrchestrator.{name} was removed: interview flow is file-based; use run_advisor_on_text()"
+            )
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     # PUBLIC_INTERFACE
     async def run_advisor_on_text(self, patient_id: str, interview_text: str, max_items: int = 3) -> Dict[str, Any]:
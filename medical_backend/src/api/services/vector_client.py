@@ -1,11 +1,28 @@
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any
+import random
+import time
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 import httpx
+import orjson
 
 from ..core.config import get_settings
 
 log = logging.getLogger("app.rag.client")
 
+# Connection pool for the vector DB: keep-alive connections are reused across advisor calls
+_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0)
+# Fail fast when the vector DB is unreachable; queries themselves may take up to 15s
+_TIMEOUT = httpx.Timeout(15.0, connect=2.0)
+# Transient failures (gateway errors, dropped/timed-out connections) are retried with jittered
+# exponential backoff; other HTTP errors (4xx, 500) fail immediately
+_MAX_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_BACKOFF_BASE_SECS = 0.05
+
 
 class VectorDBClient:
     """
@@ -15,37 +32,124 @@ class VectorDBClient:
     Assumptions:
     - POST {VECTOR_DB_URL}/query with JSON { "query": str, "top_k": int }
       returns { "results": [ {"text": str, "score": float, "source": str}, ... ] }
+
+    Successful results are cached per (normalized query, top_k) with a TTL and LRU bound
+    (VECTOR_CACHE_TTL_SECS / VECTOR_CACHE_MAX_ENTRIES); concurrent misses for the same key
+    are coalesced onto one in-flight request.
+    Gateway errors (502/503/504) and transport errors are retried with jittered backoff
+    (up to _MAX_ATTEMPTS); a query that still fails returns no results.
+    One pooled httpx.AsyncClient is kept per event loop (an AsyncClient's connections are bound
+    to the loop that opened them), so every query on a loop shares warm keep-alive connections.
     """
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._client = httpx.AsyncClient(timeout=15.0)
-
-    async def _headers(self) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
+        self._query_url = f"{self.settings.VECTOR_DB_URL.rstrip('/')}/query"
+        # Set once on each client; request bodies are pre-encoded JSON (orjson)
+        self._default_headers: Dict[str, str] = {"Content-Type": "application/json"}
         if self.settings.VECTOR_DB_API_KEY:
-            headers["Authorization"] = f"Bearer {self.settings.VECTOR_DB_API_KEY}"
-        return headers
+            self._default_headers["Authorization"] = f"Bearer {self.settings.VECTOR_DB_API_KEY}"
+        # Weak keys: clients of loops that have gone away are dropped with them
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Keys are (blake2b of the stripped, lowercased query, top_k)
+        # key -> (stored_at monotonic, results); only successful responses are stored
+        self._cache: "OrderedDict[Tuple[bytes, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        # key -> in-flight request shared by concurrent identical callers
+        self._inflight: Dict[Tuple[bytes, int], "asyncio.Future[List[Dict[str, Any]]]"] = {}
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=_TIMEOUT,
+                headers=self._default_headers,
+                # retries=1 re-attempts failed connection setup only (never a sent request)
+                transport=httpx.AsyncHTTPTransport(limits=_POOL_LIMITS, retries=1),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def _post_query(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+        body = orjson.dumps({"query": query, "top_k": top_k})
+        client = self._client()
+        attempt = 1
+        while True:
+            try:
+                resp = await client.post(self._query_url, content=body)
+                if resp.status_code not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS:
+                    resp.raise_for_status()
+                    return orjson.loads(resp.content).get("results", [])
+                reason = f"HTTP {resp.status_code}"
+            except httpx.TransportError as ex:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                reason = type(ex).__name__
+            delay = _BACKOFF_BASE_SECS * (2 ** (attempt - 1)) * (1.0 + random.random())
+            log.warning(
+                "Vector DB query attempt %d/%d failed (%s); retrying in %.0f ms",
+                attempt, _MAX_ATTEMPTS, reason, delay * 1000,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _cache_get(self, key: Tuple[bytes, int]) -> Optional[List[Dict[str, Any]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.settings.VECTOR_CACHE_TTL_SECS:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: Tuple[bytes, int], results: List[Dict[str, Any]]) -> None:
+        max_entries = self.settings.VECTOR_CACHE_MAX_ENTRIES
+        if max_entries <= 0:
+            return
+        self._cache[key] = (time.monotonic(), results)
+        self._cache.move_to_end(key)
+        while len(self._cache) > max_entries:
+            self._cache.popitem(last=False)
+
+    def _finish_inflight(self, key: Tuple[bytes, int], fut: "asyncio.Future[List[Dict[str, Any]]]") -> None:
+        self._inflight.pop(key, None)
+        if fut.cancelled():
+            return
+        # Reading the exception also marks it retrieved; awaiting callers log it themselves
+        if fut.exception() is None:
+            self._cache_put(key, fut.result())
 
     # PUBLIC_INTERFACE
     async def query(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Query the vector database for relevant guideline snippets."""
-        url = f"{self.settings.VECTOR_DB_URL.rstrip('/')}/query"
-        payload = {"query": query, "top_k": top_k}
-        headers = await self._headers()
-        log.info("RAG query: %s", query[:200])
+        # %.200s truncates inside logging, so no slice is built when INFO is disabled
+        log.info("RAG query: %.200s", query)
+        key = (hashlib.blake2b(query.strip().lower().encode("utf-8"), digest_size=16).digest(), top_k)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._post_query(query, top_k))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda fut: self._finish_inflight(key, fut))
         try:
-            resp = await self._client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("results", [])
+            # shield: a cancelled caller must not cancel the request other callers are awaiting
+            results = await asyncio.shield(inflight)
         except Exception as ex:
             log.exception("Vector DB query failed: %s", ex)
             return []
+        # Each caller gets its own list
+        return list(results)
 
     async def aclose(self) -> None:
-        """Close underlying HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client (and its pooled connections) of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
 
 vector_client = VectorDBClient()